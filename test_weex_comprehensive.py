@@ -7,45 +7,144 @@ Tests both REST API and Pro WebSocket functionality
 
 import sys
 import os
-import traceback
+import atexit
+import functools
+import time
 import asyncio
-from typing import Dict, Any
+import importlib.util
+from typing import Dict, Any, List
 
-# Add the python directory to the path to import local ccxt
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
+# Load the local ccxt package straight from its spec rather than putting the
+# python directory on sys.path, which every later import would have to scan
+_CCXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python', 'ccxt')
+
+_CCXT_INIT = os.path.join(_CCXT_DIR, '__init__.py')
 
 try:
-    import ccxt
+    # Reuse the package if this file is imported again (e.g. by pytest after
+    # running as a script) instead of re-executing the whole ccxt tree.
+    # module_from_spec sets __file__ before executing, so also require
+    # `exchanges`, which ccxt only defines once all exchanges are imported
+    ccxt = sys.modules.get('ccxt')
+    if getattr(ccxt, '__file__', None) != _CCXT_INIT or not hasattr(ccxt, 'exchanges'):
+        # exec_module would raise FileNotFoundError, which is not an ImportError
+        if not os.path.isfile(_CCXT_INIT):
+            raise ModuleNotFoundError("No module named 'ccxt'", name='ccxt')
+        _spec = importlib.util.spec_from_file_location(
+            'ccxt',
+            _CCXT_INIT,
+            submodule_search_locations=[_CCXT_DIR],
+        )
+        ccxt = importlib.util.module_from_spec(_spec)
+        sys.modules['ccxt'] = ccxt
+        _spec.loader.exec_module(ccxt)
     import ccxt.pro as ccxtpro
 except ImportError as e:
+    # Drop a partially executed package, as a regular failed import would
+    sys.modules.pop('ccxt', None)
     print(f"❌ Import error: {e}")
     sys.exit(1)
 
+# Exchange ids as a set, for O(1) membership checks
+_EXCHANGES = frozenset(ccxt.exchanges)
+
+# Print full tracebacks for failing tests when WEEX_TEST_VERBOSE=1
+VERBOSE = os.environ.get('WEEX_TEST_VERBOSE') == '1'
+
+# Time handle_deltas on a bulk order book update when WEEX_TEST_BENCH=1
+BENCH = os.environ.get('WEEX_TEST_BENCH') == '1'
+
+# Error codes that must be mapped in exchange.exceptions['exact']
+_EXPECTED_EXACT = frozenset({'40001', '43001', '429'})
+
+# (ccxt timeframe, WEEX interval) pairs the Pro conversions must round-trip
+_TIMEFRAME_INTERVALS = (
+    ('1m', 'MINUTE_1'),
+    ('5m', 'MINUTE_5'),
+)
+
+# Capabilities the Pro exchange must advertise in exchange.has
+_PRO_CAPS = (
+    'ws', 'watchTicker', 'watchTrades', 'watchOrderBook',
+    'watchBalance', 'watchOHLCV', 'watchOrders', 'watchMyTrades'
+)
+
+# WebSocket message handlers the Pro exchange must implement
+_PRO_HANDLERS = frozenset({
+    'handle_message', 'handle_ping', 'handle_pong',
+    'handle_ticker', 'handle_trades', 'handle_order_book',
+    'handle_ohlcv', 'handle_balance', 'handle_orders',
+    'handle_my_trades', 'handle_subscription_status'
+})
+
+# Report template used by WeexTestSuite.print_summary
+_SUMMARY = (
+    "\n" + "=" * 60 + "\n"
+    "WEEX COMPREHENSIVE TEST RESULTS\n"
+    + "=" * 60 + "\n"
+    "Total Tests: {t}\n"
+    "Passed: {p} ✅\n"
+    "Failed: {f} ❌\n"
+    "Success Rate: {r:.1f}%"
+)
+
+class _TestResult:
+    """Outcome of a single logged test"""
+    __slots__ = ('name', 'passed', 'message')
+
+    def __init__(self, name: str, passed: bool, message: str):
+        self.name = name
+        self.passed = passed
+        self.message = message
+
 class WeexTestSuite:
     def __init__(self):
-        self.results = {'passed': 0, 'failed': 0, 'tests': []}
+        self._results = []
+        self._passed = 0
+        self._failed = 0
+        self._rest = None
+        self._pro = None
+        self._pro_attrs = None
+        self._log_buf = []
+        self._loop = None
+
+    def _rest_exchange(self):
+        """Return a shared WEEX REST instance, created on first use"""
+        if self._rest is None:
+            self._rest = ccxt.weex()
+        return self._rest
+
+    def _pro_exchange(self):
+        """Return a shared WEEX Pro instance, created on first use"""
+        # ccxt.pro.weex subclasses the REST class, so tests that only need
+        # inherited REST attributes check them through this instance
+        if self._pro is None:
+            self._pro = ccxtpro.weex()
+        return self._pro
+
+    def _pro_exchange_attrs(self):
+        """Return the attribute names of the shared Pro instance, computed once"""
+        if self._pro_attrs is None:
+            self._pro_attrs = frozenset(dir(self._pro_exchange()))
+        return self._pro_attrs
     
     def log_test(self, test_name: str, passed: bool, message: str = ""):
-        """Log test results"""
+        """Log test results (buffered until print_summary)"""
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status}: {test_name} {message}")
+        self._log_buf.append(f"{status}: {test_name} {message}")
         
-        self.results['tests'].append({
-            'name': test_name,
-            'passed': passed,
-            'message': message
-        })
+        self._results.append(_TestResult(test_name, passed, message))
         
         if passed:
-            self.results['passed'] += 1
+            self._passed += 1
         else:
-            self.results['failed'] += 1
+            self._failed += 1
 
-    def test_basic_import(self):
+    async def test_basic_import(self):
         """Test basic CCXT library import and WEEX availability"""
         try:
             # Test that weex is in the exchanges list
-            assert 'weex' in ccxt.exchanges, "WEEX not found in ccxt.exchanges"
+            assert 'weex' in _EXCHANGES, "WEEX not found in ccxt.exchanges"
             self.log_test("Basic Import - WEEX in exchanges", True)
             
             # Test that ccxt.pro imports successfully
@@ -57,11 +156,11 @@ class WeexTestSuite:
             self.log_test("Basic Import", False, str(e))
             return False
 
-    def test_exchange_instantiation(self):
+    async def test_exchange_instantiation(self):
         """Test WEEX exchange instantiation (REST)"""
         try:
             # Create WEEX exchange instance
-            exchange = ccxt.weex()
+            exchange = self._rest_exchange()
             
             # Test basic properties
             assert exchange.id == 'weex', f"Expected id 'weex', got '{exchange.id}'"
@@ -78,47 +177,45 @@ class WeexTestSuite:
             return True
         except Exception as e:
             self.log_test("REST Exchange Instantiation", False, f"Error: {e}")
-            traceback.print_exc()
+            if VERBOSE:
+                import traceback
+                traceback.print_exc()
             return False
 
-    def test_pro_exchange_instantiation(self):
+    async def test_pro_exchange_instantiation(self):
         """Test WEEX Pro WebSocket exchange instantiation"""
         try:
             # Create WEEX Pro exchange instance
-            exchange = ccxtpro.weex()
+            exchange = self._pro_exchange()
             
             # Test basic properties
             assert exchange.id == 'weex', f"Expected id 'weex', got '{exchange.id}'"
             assert exchange.name == 'WEEX', f"Expected name 'WEEX', got '{exchange.name}'"
             
             # Test Pro-specific capabilities
-            assert exchange.has['ws'], "WEEX Pro should support WebSocket"
-            assert exchange.has['watchTicker'], "WEEX Pro should support watchTicker"
-            assert exchange.has['watchTrades'], "WEEX Pro should support watchTrades"
-            assert exchange.has['watchOrderBook'], "WEEX Pro should support watchOrderBook"
-            assert exchange.has['watchBalance'], "WEEX Pro should support watchBalance"
-            assert exchange.has['watchOHLCV'], "WEEX Pro should support watchOHLCV"
-            assert exchange.has['watchOrders'], "WEEX Pro should support watchOrders"
-            assert exchange.has['watchMyTrades'], "WEEX Pro should support watchMyTrades"
+            missing_caps = [cap for cap in _PRO_CAPS if not exchange.has.get(cap)]
+            assert not missing_caps, f"WEEX Pro should support: {missing_caps}"
             
             # Test critical methods exist and are callable
-            assert hasattr(exchange, 'watch_ticker'), "WEEX Pro missing watch_ticker method"
-            assert hasattr(exchange, 'watch_trades'), "WEEX Pro missing watch_trades method"
-            assert hasattr(exchange, 'watch_order_book'), "WEEX Pro missing watch_order_book method"
-            assert hasattr(exchange, 'handle_deltas'), "WEEX Pro missing handle_deltas method"
+            methods = ('watch_ticker', 'watch_trades', 'watch_order_book', 'handle_deltas')
+            exchange_attrs = self._pro_exchange_attrs()
+            missing_methods = [method for method in methods if method not in exchange_attrs]
+            assert not missing_methods, f"WEEX Pro missing methods: {missing_methods}"
             
             self.log_test("Pro Exchange Instantiation", True, f"Created {exchange.name} Pro exchange")
             return True
         except Exception as e:
             self.log_test("Pro Exchange Instantiation", False, f"Error: {e}")
-            traceback.print_exc()
+            if VERBOSE:
+                import traceback
+                traceback.print_exc()
             return False
 
-    def test_error_handling_void_issue(self):
+    async def test_error_handling_void_issue(self):
         """Test that the void error is fixed in both REST and Pro"""
         try:
             # Test REST exchange handleErrors method
-            exchange = ccxt.weex()
+            exchange = self._rest_exchange()
             
             # This should work without NameError: name 'void' is not defined
             response = {'code': '00000', 'msg': 'success', 'data': {}}
@@ -133,7 +230,7 @@ class WeexTestSuite:
                     raise e
             
             # Test Pro exchange handle_deltas method
-            pro_exchange = ccxtpro.weex()
+            pro_exchange = self._pro_exchange()
             
             # This should work without NameError: name 'void' is not defined
             bookside = {}
@@ -149,16 +246,27 @@ class WeexTestSuite:
                 else:
                     raise e
             
+            if BENCH:
+                bookside = {}
+                deltas = [{'price': str(100 + i * 0.01), 'size': '1.0'} for i in range(1000)]
+                start = time.perf_counter_ns()
+                pro_exchange.handle_deltas(bookside, deltas)
+                elapsed = time.perf_counter_ns() - start
+                assert len(bookside) == len(deltas), f"Expected {len(deltas)} price levels, got {len(bookside)}"
+                self.log_test("Pro handle_deltas - Bulk update", True, f"{elapsed / len(deltas):.0f} ns/delta")
+            
             return True
         except Exception as e:
             self.log_test("Error Handling - Void Issue", False, f"Unexpected error: {e}")
-            traceback.print_exc()
+            if VERBOSE:
+                import traceback
+                traceback.print_exc()
             return False
 
-    def test_api_endpoints(self):
+    async def test_api_endpoints(self):
         """Test API endpoint configuration"""
         try:
-            exchange = ccxt.weex()
+            exchange = self._rest_exchange()
             
             # Test REST API URLs
             assert 'public' in exchange.urls['api'], "Missing public API URL"
@@ -167,7 +275,7 @@ class WeexTestSuite:
             assert 'api-spot.weex.com' in exchange.urls['api']['private'], "Incorrect private API URL"
             
             # Test Pro WebSocket URLs
-            pro_exchange = ccxtpro.weex()
+            pro_exchange = self._pro_exchange()
             assert 'ws' in pro_exchange.urls['api'], "Missing WebSocket API URLs"
             assert 'public' in pro_exchange.urls['api']['ws'], "Missing public WebSocket URL"
             assert 'private' in pro_exchange.urls['api']['ws'], "Missing private WebSocket URL"
@@ -180,10 +288,10 @@ class WeexTestSuite:
             self.log_test("API Endpoints Configuration", False, str(e))
             return False
 
-    def test_error_mappings(self):
+    async def test_error_mappings(self):
         """Test error code mappings"""
         try:
-            exchange = ccxt.weex()
+            exchange = self._rest_exchange()
             
             # Test that error mappings exist
             assert 'exact' in exchange.exceptions, "Missing exact error mappings"
@@ -191,9 +299,8 @@ class WeexTestSuite:
             
             # Test specific error codes
             exact_errors = exchange.exceptions['exact']
-            assert '40001' in exact_errors, "Missing authentication error mapping"
-            assert '43001' in exact_errors, "Missing order not found error mapping"
-            assert '429' in exact_errors, "Missing rate limit error mapping"
+            missing = _EXPECTED_EXACT - exact_errors.keys()
+            assert not missing, f"Missing error code mappings: {sorted(missing)}"
             
             self.log_test("Error Mappings", True, f"Found {len(exact_errors)} error codes")
             return True
@@ -201,27 +308,26 @@ class WeexTestSuite:
             self.log_test("Error Mappings", False, str(e))
             return False
 
-    def test_timeframes(self):
+    async def test_timeframes(self):
         """Test timeframe configuration"""
         try:
-            exchange = ccxt.weex()
-            pro_exchange = ccxtpro.weex()
+            pro_exchange = self._pro_exchange()
             
-            # Test REST timeframes
-            assert '1m' in exchange.timeframes, "Missing 1m timeframe"
-            assert '1h' in exchange.timeframes, "Missing 1h timeframe"
-            assert '1d' in exchange.timeframes, "Missing 1d timeframe"
+            # Test inherited REST timeframes, checked through Pro
+            assert '1m' in pro_exchange.timeframes, "Missing 1m timeframe"
+            assert '1h' in pro_exchange.timeframes, "Missing 1h timeframe"
+            assert '1d' in pro_exchange.timeframes, "Missing 1d timeframe"
             
             # Test Pro timeframe conversion methods
             assert hasattr(pro_exchange, 'timeframe_to_weex_interval'), "Missing timeframe conversion method"
             assert hasattr(pro_exchange, 'weex_interval_to_timeframe'), "Missing interval conversion method"
             
-            # Test conversion functions
-            weex_interval = pro_exchange.timeframe_to_weex_interval('1m')
-            assert weex_interval == 'MINUTE_1', f"Expected 'MINUTE_1', got '{weex_interval}'"
-            
-            timeframe = pro_exchange.weex_interval_to_timeframe('MINUTE_5')
-            assert timeframe == '5m', f"Expected '5m', got '{timeframe}'"
+            # Test conversion functions in both directions
+            for timeframe, interval in _TIMEFRAME_INTERVALS:
+                weex_interval = pro_exchange.timeframe_to_weex_interval(timeframe)
+                assert weex_interval == interval, f"Expected '{interval}', got '{weex_interval}'"
+                converted = pro_exchange.weex_interval_to_timeframe(interval)
+                assert converted == timeframe, f"Expected '{timeframe}', got '{converted}'"
             
             self.log_test("Timeframes Configuration", True)
             return True
@@ -229,23 +335,20 @@ class WeexTestSuite:
             self.log_test("Timeframes Configuration", False, str(e))
             return False
 
-    def test_parsing_methods(self):
+    async def test_parsing_methods(self):
         """Test data parsing methods"""
         try:
-            exchange = ccxt.weex()
-            pro_exchange = ccxtpro.weex()
+            exchange_attrs = self._pro_exchange_attrs()
             
-            # Test REST parsing methods
-            assert hasattr(exchange, 'parseTicker'), "Missing parseTicker method"
-            assert hasattr(exchange, 'parseTrade'), "Missing parseTrade method"
-            assert hasattr(exchange, 'parseOrder'), "Missing parseOrder method"
-            assert hasattr(exchange, 'parseBalance'), "Missing parseBalance method"
+            # Test inherited REST parsing methods, checked through Pro
+            rest_methods = ('parseTicker', 'parseTrade', 'parseOrder', 'parseBalance')
+            missing = [method for method in rest_methods if method not in exchange_attrs]
+            assert not missing, f"Missing REST parsing methods: {missing}"
             
-            # Test Pro parsing methods  
-            assert hasattr(pro_exchange, 'parse_ws_trade'), "Missing parse_ws_trade method"
-            assert hasattr(pro_exchange, 'parse_ws_ohlcv'), "Missing parse_ws_ohlcv method"
-            assert hasattr(pro_exchange, 'parse_ws_my_trade'), "Missing parse_ws_my_trade method"
-            assert hasattr(pro_exchange, 'parse_ws_order'), "Missing parse_ws_order method"
+            # Test Pro parsing methods
+            pro_methods = ('parse_ws_trade', 'parse_ws_ohlcv', 'parse_ws_my_trade', 'parse_ws_order')
+            missing = [method for method in pro_methods if method not in exchange_attrs]
+            assert not missing, f"Missing Pro parsing methods: {missing}"
             
             self.log_test("Parsing Methods", True)
             return True
@@ -253,50 +356,127 @@ class WeexTestSuite:
             self.log_test("Parsing Methods", False, str(e))
             return False
 
-    def test_message_handlers(self):
+    async def test_message_handlers(self):
         """Test WebSocket message handlers"""
         try:
-            pro_exchange = ccxtpro.weex()
-            
             # Test handler methods exist
-            handlers = [
-                'handle_message', 'handle_ping', 'handle_pong', 
-                'handle_ticker', 'handle_trades', 'handle_order_book',
-                'handle_ohlcv', 'handle_balance', 'handle_orders', 
-                'handle_my_trades', 'handle_subscription_status'
-            ]
-            
-            for handler in handlers:
-                assert hasattr(pro_exchange, handler), f"Missing {handler} method"
+            missing = _PRO_HANDLERS - self._pro_exchange_attrs()
+            assert not missing, f"Missing handler methods: {sorted(missing)}"
             
-            self.log_test("WebSocket Message Handlers", True, f"Found all {len(handlers)} handlers")
+            self.log_test("WebSocket Message Handlers", True, f"Found all {len(_PRO_HANDLERS)} handlers")
             return True
         except Exception as e:
             self.log_test("WebSocket Message Handlers", False, str(e))
             return False
 
+    def flush_log(self):
+        """Write buffered log lines to stdout in one go"""
+        if self._log_buf:
+            sys.stdout.write('\n'.join(self._log_buf) + '\n')
+            sys.stdout.flush()
+            self._log_buf.clear()
+
+    def run_group(self, name: str) -> List[str]:
+        """Run one test group on the suite's event loop and return its failure messages"""
+        # The cached Pro exchange binds to the loop it first opens on, so every
+        # group run through the same suite must share one loop
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        start = len(self._results)
+        try:
+            passed = self._loop.run_until_complete(getattr(self, name)())
+        finally:
+            self.flush_log()
+        failures = [f"{r.name}: {r.message}" for r in self._results[start:] if not r.passed]
+        if not passed and not failures:
+            failures.append(f"{name} failed")
+        return failures
+
+    def close(self):
+        """Close the cached Pro exchange and the suite's event loop"""
+        if self._loop is None:
+            return
+        if self._pro is not None:
+            self._loop.run_until_complete(self._pro.close())
+        self._loop.close()
+        self._loop = None
+
     def print_summary(self):
         """Print test results summary"""
-        total = self.results['passed'] + self.results['failed']
-        print(f"\n{'='*60}")
-        print(f"WEEX COMPREHENSIVE TEST RESULTS")
-        print(f"{'='*60}")
-        print(f"Total Tests: {total}")
-        print(f"Passed: {self.results['passed']} ✅")
-        print(f"Failed: {self.results['failed']} ❌")
-        print(f"Success Rate: {(self.results['passed']/total*100):.1f}%" if total > 0 else "Success Rate: 0%")
+        self.flush_log()
+        total = self._passed + self._failed
+        rate = self._passed / total * 100 if total else 0.0
+        print(_SUMMARY.format(t=total, p=self._passed, f=self._failed, r=rate))
         
-        if self.results['failed'] > 0:
+        if self._failed > 0:
             print(f"\nFailed Tests:")
-            for test in self.results['tests']:
-                if not test['passed']:
-                    print(f"  ❌ {test['name']}: {test['message']}")
+            for test in self._results:
+                if not test.passed:
+                    print(f"  ❌ {test.name}: {test.message}")
         
         print(f"{'='*60}")
-        return self.results['failed'] == 0
+        return self._failed == 0
+
+# pytest entry points: each group is a top-level test so that pytest-xdist
+# can shard them across workers (pytest -n auto test_weex_comprehensive.py).
+# The suite, and with it the cached exchanges and event loop, is shared per process.
+@functools.lru_cache(maxsize=None)
+def _process_suite() -> 'WeexTestSuite':
+    """Return the suite shared by every pytest test in this process"""
+    suite = WeexTestSuite()
+    atexit.register(suite.close)
+    return suite
+
+def _run_group(name: str):
+    """Run a single suite group and fail with the messages it logged"""
+    failures = _process_suite().run_group(name)
+    assert not failures, '; '.join(failures)
+
+def test_basic_import():
+    _run_group('test_basic_import')
+
+def test_exchange_instantiation():
+    _run_group('test_exchange_instantiation')
+
+def test_pro_exchange_instantiation():
+    _run_group('test_pro_exchange_instantiation')
+
+def test_error_handling_void_issue():
+    _run_group('test_error_handling_void_issue')
+
+def test_api_endpoints():
+    _run_group('test_api_endpoints')
+
+def test_error_mappings():
+    _run_group('test_error_mappings')
+
+def test_timeframes():
+    _run_group('test_timeframes')
+
+def test_parsing_methods():
+    _run_group('test_parsing_methods')
+
+def test_message_handlers():
+    _run_group('test_message_handlers')
+
+async def _run_all(precondition, tests):
+    """Run the precondition, then all other test groups concurrently on the current event loop"""
+    # Every other group needs WEEX to be importable, so stop early if it is not
+    if not await precondition():
+        return None
+    # log_test never awaits, so tasks cannot interleave inside it and the
+    # shared counters need no lock
+    return await asyncio.gather(*(test() for test in tests), return_exceptions=True)
 
 def main():
     """Run all WEEX tests"""
+    # Use uvloop for the event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     print("🚀 Starting WEEX Exchange Comprehensive Test Suite")
     print("="*60)
     
@@ -304,7 +484,6 @@ def main():
     
     # Run all tests
     tests = [
-        suite.test_basic_import,
         suite.test_exchange_instantiation,
         suite.test_pro_exchange_instantiation,
         suite.test_error_handling_void_issue,
@@ -315,20 +494,29 @@ def main():
         suite.test_message_handlers,
     ]
     
-    print(f"Running {len(tests)} test groups...\n")
+    print(f"Running {len(tests) + 1} test groups...\n")
+    
+    results = asyncio.run(_run_all(suite.test_basic_import, tests))
+    if results is None:
+        suite.print_summary()
+        print("⚠️  WEEX is not available, skipping the remaining tests.")
+        return 1
     
     all_passed = True
-    for test in tests:
-        try:
-            if not test():
-                all_passed = False
-        except Exception as e:
-            print(f"❌ Test {test.__name__} crashed: {e}")
-            traceback.print_exc()
+    for test, result in zip(tests, results):
+        if isinstance(result, BaseException):
+            # CancelledError is a BaseException, so check for that rather than
+            # Exception or a cancelled group would be counted as passing
+            suite.log_test(test.__name__, False, f"crashed: {result!r}")
+            if VERBOSE:
+                import traceback
+                traceback.print_exception(type(result), result, result.__traceback__)
+            all_passed = False
+        elif not result:
             all_passed = False
     
     # Print summary
-    success = suite.print_summary()
+    success = suite.print_summary() and all_passed
     
     if success:
         print("🎉 All tests passed! WEEX implementation is working correctly.")